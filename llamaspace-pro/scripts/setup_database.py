@@ -14,20 +14,25 @@ import os
 import sys
 import time
 import logging
-import subprocess
-import json
+import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import quote, quote_plus
 import yaml
 
 import dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
 import pymongo
 import redis
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+# Prefer the libyaml C loader for sample data when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -64,220 +69,383 @@ REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = os.getenv("REDIS_PORT", "6379")
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
 
-# Check if Docker is available
-def is_docker_available():
+# Connection strings; credentials are escaped so characters such as
+# "@", ":" and "%" in passwords do not break URI parsing
+PG_URI = f"postgresql://{quote(PG_USER, safe='')}:{quote(PG_PASSWORD, safe='')}@{PG_HOST}:{PG_PORT}/{PG_DB}"
+if MONGO_USER and MONGO_PASSWORD:
+    MONGO_URI = f"mongodb://{quote_plus(MONGO_USER)}:{quote_plus(MONGO_PASSWORD)}@{MONGO_HOST}:{MONGO_PORT}/{MONGO_DB}?authSource=admin"
+else:
+    MONGO_URI = f"mongodb://{MONGO_HOST}:{MONGO_PORT}/{MONGO_DB}"
+
+# Docker containers for each database, as containers.run() arguments
+DOCKER_CONTAINERS = [
+    ("TimescaleDB", {
+        "image": "timescale/timescaledb:latest-pg14",
+        "name": "llamaspace-timescaledb",
+        "environment": {
+            "POSTGRES_USER": PG_USER,
+            "POSTGRES_PASSWORD": PG_PASSWORD,
+            "POSTGRES_DB": PG_DB
+        },
+        "ports": {"5432/tcp": int(PG_PORT)},
+        "volumes": {
+            "llamaspace-timescaledb-data": {"bind": "/var/lib/postgresql/data", "mode": "rw"}
+        }
+    }),
+    ("MongoDB", {
+        "image": "mongo:latest",
+        "name": "llamaspace-mongodb",
+        "environment": {
+            "MONGO_INITDB_ROOT_USERNAME": MONGO_USER,
+            "MONGO_INITDB_ROOT_PASSWORD": MONGO_PASSWORD
+        },
+        "ports": {"27017/tcp": int(MONGO_PORT)},
+        "volumes": {
+            "llamaspace-mongodb-data": {"bind": "/data/db", "mode": "rw"}
+        }
+    }),
+    ("Redis", {
+        "image": "redis:latest",
+        "name": "llamaspace-redis",
+        "environment": {"REDIS_PASSWORD": REDIS_PASSWORD} if REDIS_PASSWORD else None,
+        "command": ["--requirepass", REDIS_PASSWORD] if REDIS_PASSWORD else None,
+        "ports": {"6379/tcp": int(REDIS_PORT)},
+        "volumes": {
+            "llamaspace-redis-data": {"bind": "/data", "mode": "rw"}
+        }
+    })
+]
+
+# TimescaleDB schema
+TIMESCALEDB_DDL = """
+CREATE EXTENSION IF NOT EXISTS timescaledb CASCADE;
+
+-- Telemetry hypertable
+CREATE TABLE IF NOT EXISTS satellite_telemetry (
+    time TIMESTAMPTZ NOT NULL,
+    satellite_id TEXT NOT NULL,
+    subsystem TEXT NOT NULL,
+    parameter TEXT NOT NULL,
+    value DOUBLE PRECISION,
+    status TEXT,
+    metadata JSONB
+);
+SELECT create_hypertable('satellite_telemetry', 'time', if_not_exists => TRUE);
+CREATE INDEX IF NOT EXISTS idx_satellite_telemetry_satellite_id ON satellite_telemetry (satellite_id);
+CREATE INDEX IF NOT EXISTS idx_satellite_telemetry_subsystem ON satellite_telemetry (subsystem);
+CREATE INDEX IF NOT EXISTS idx_satellite_telemetry_parameter ON satellite_telemetry (parameter);
+
+-- Orbit hypertable
+CREATE TABLE IF NOT EXISTS satellite_orbits (
+    time TIMESTAMPTZ NOT NULL,
+    satellite_id TEXT NOT NULL,
+    position_x DOUBLE PRECISION,
+    position_y DOUBLE PRECISION,
+    position_z DOUBLE PRECISION,
+    velocity_x DOUBLE PRECISION,
+    velocity_y DOUBLE PRECISION,
+    velocity_z DOUBLE PRECISION,
+    metadata JSONB
+);
+SELECT create_hypertable('satellite_orbits', 'time', if_not_exists => TRUE);
+
+-- Maneuver table
+CREATE TABLE IF NOT EXISTS satellite_maneuvers (
+    id SERIAL PRIMARY KEY,
+    satellite_id TEXT NOT NULL,
+    start_time TIMESTAMPTZ NOT NULL,
+    end_time TIMESTAMPTZ,
+    type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    delta_v_x DOUBLE PRECISION,
+    delta_v_y DOUBLE PRECISION,
+    delta_v_z DOUBLE PRECISION,
+    fuel_used DOUBLE PRECISION,
+    success BOOLEAN,
+    description TEXT,
+    parameters JSONB,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+"""
+
+# Schema fragments shared by MongoDB collection validators
+_COMMON_PROPS = {"metadata": {"bsonType": "object"}}
+
+# MongoDB collections with their validation schemas and indexes
+MONGO_COLLECTIONS = [
+    # Satellites collection
+    ("satellites", {
+        "$jsonSchema": {
+            "bsonType": "object",
+            "required": ["satellite_id", "name", "type", "status"],
+            "properties": {
+                "satellite_id": {"bsonType": "string"},
+                "name": {"bsonType": "string"},
+                "type": {"bsonType": "string"},
+                "status": {"bsonType": "string"},
+                "launch_date": {"bsonType": "date"},
+                "mission": {"bsonType": "string"},
+                "owner": {"bsonType": "string"},
+                "tle": {
+                    "bsonType": "object",
+                    "properties": {
+                        "line1": {"bsonType": "string"},
+                        "line2": {"bsonType": "string"},
+                        "epoch": {"bsonType": "date"}
+                    }
+                },
+                "subsystems": {"bsonType": "array"},
+                **_COMMON_PROPS
+            }
+        }
+    }, [pymongo.IndexModel("satellite_id", unique=True)]),
+    
+    # Ground Stations collection
+    ("ground_stations", {
+        "$jsonSchema": {
+            "bsonType": "object",
+            "required": ["station_id", "name", "location"],
+            "properties": {
+                "station_id": {"bsonType": "string"},
+                "name": {"bsonType": "string"},
+                "location": {
+                    "bsonType": "object",
+                    "required": ["latitude", "longitude"],
+                    "properties": {
+                        "latitude": {"bsonType": "double"},
+                        "longitude": {"bsonType": "double"},
+                        "altitude": {"bsonType": "double"}
+                    }
+                },
+                "capabilities": {"bsonType": "array"},
+                "status": {"bsonType": "string"},
+                **_COMMON_PROPS
+            }
+        }
+    }, [pymongo.IndexModel("station_id", unique=True)]),
+    
+    # Users collection
+    ("users", {
+        "$jsonSchema": {
+            "bsonType": "object",
+            "required": ["username", "email", "role"],
+            "properties": {
+                "username": {"bsonType": "string"},
+                "email": {"bsonType": "string"},
+                "first_name": {"bsonType": "string"},
+                "last_name": {"bsonType": "string"},
+                "role": {"bsonType": "string"},
+                "permissions": {"bsonType": "array"},
+                "created_at": {"bsonType": "date"},
+                "last_login": {"bsonType": "date"},
+                "settings": {"bsonType": "object"}
+            }
+        }
+    }, [
+        pymongo.IndexModel("username", unique=True),
+        pymongo.IndexModel("email", unique=True)
+    ]),
+    
+    # Mission Plans collection
+    ("mission_plans", {
+        "$jsonSchema": {
+            "bsonType": "object",
+            "required": ["plan_id", "name", "satellite_id", "status"],
+            "properties": {
+                "plan_id": {"bsonType": "string"},
+                "name": {"bsonType": "string"},
+                "satellite_id": {"bsonType": "string"},
+                "created_by": {"bsonType": "string"},
+                "created_at": {"bsonType": "date"},
+                "status": {"bsonType": "string"},
+                "start_time": {"bsonType": "date"},
+                "end_time": {"bsonType": "date"},
+                "activities": {"bsonType": "array"},
+                **_COMMON_PROPS
+            }
+        }
+    }, [
+        pymongo.IndexModel("plan_id", unique=True),
+        pymongo.IndexModel("satellite_id")
+    ])
+]
+
+# Connect to the Docker daemon, returning None if it is not available.
+# The SDK is imported lazily so the script still runs without it when the
+# databases are already up or managed outside Docker
+def get_docker_client():
     try:
-        subprocess.run(["docker", "--version"], 
-                      stdout=subprocess.PIPE, 
-                      stderr=subprocess.PIPE, 
-                      check=True)
+        import docker
+        import requests
+    except ImportError:
+        return None
+    try:
+        client = docker.from_env()
+        client.ping()
+        return client
+    except (docker.errors.DockerException, requests.exceptions.RequestException):
+        # The SDK raises transport failures as raw requests exceptions
+        return None
+
+# Readiness probes. These talk each database's protocol rather than just
+# opening a TCP connection: Docker's proxy accepts connections on published
+# ports as soon as a container starts, while Postgres may still be running
+# initdb and mongod restarts after creating the root user. An authentication
+# failure means the server is serving, so the probes report it as ready and
+# leave the setup functions to report the credentials error
+def timescaledb_ready():
+    try:
+        engine = create_engine(PG_URI, poolclass=NullPool, connect_args={"connect_timeout": 2})
+    except ImportError:
+        # No PostgreSQL driver; setup_timescaledb reports the error
+        return False
+    try:
+        with engine.connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
+        return True
+    except OperationalError as e:
+        return "authentication failed" in str(e)
+    finally:
+        engine.dispose()
+
+def mongodb_ready():
+    client = None
+    try:
+        client = pymongo.MongoClient(MONGO_URI, connect=False, serverSelectionTimeoutMS=2000)
+        client.admin.command("ping")
+        return True
+    except pymongo.errors.OperationFailure as e:
+        # Error code 18 is AuthenticationFailed
+        return e.code == 18
+    except pymongo.errors.PyMongoError:
+        return False
+    finally:
+        if client is not None:
+            client.close()
+
+def redis_ready():
+    r = redis.Redis(
+        host=REDIS_HOST,
+        port=int(REDIS_PORT),
+        password=REDIS_PASSWORD if REDIS_PASSWORD else None,
+        socket_connect_timeout=2,
+        socket_timeout=2
+    )
+    try:
+        return r.ping()
+    except redis.exceptions.AuthenticationError:
         return True
-    except (subprocess.SubprocessError, FileNotFoundError):
+    except redis.exceptions.RedisError:
         return False
+    finally:
+        r.close()
+
+READINESS_PROBES = {
+    "TimescaleDB": timescaledb_ready,
+    "MongoDB": mongodb_ready,
+    "Redis": redis_ready
+}
+
+# Wait until a readiness probe succeeds, backing off between attempts
+def wait_ready(probe, timeout=60):
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        if probe():
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    return False
 
 # Function to start Docker containers for databases
-def start_docker_databases():
+def start_docker_databases(client):
+    import docker
+    import requests
+    
     console.print(Panel.fit("Starting Docker containers for databases", 
                           style="bold blue"))
     
-    # Create Docker network if it doesn't exist
-    subprocess.run(
-        ["docker", "network", "create", "--driver", "bridge", "llamaspace-network"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    
-    # Check if containers are already running
-    containers = {
-        "timescaledb": False,
-        "mongodb": False,
-        "redis": False
-    }
+    docker_errors = (docker.errors.DockerException, requests.exceptions.RequestException)
     
-    result = subprocess.run(
-        ["docker", "ps", "--format", "{{.Names}}"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    try:
+        # Create Docker network if it doesn't exist
+        if not client.networks.list(names=["llamaspace-network"]):
+            try:
+                client.networks.create("llamaspace-network", driver="bridge")
+            except docker_errors as e:
+                console.print(f"[yellow]Could not create llamaspace-network: {e}[/yellow]")
+        
+        # Check if containers are already running
+        running_containers = {container.name for container in client.containers.list()}
+    except docker_errors as e:
+        console.print(f"[red]Error querying Docker: {e}[/red]")
+        console.print("[yellow]No containers were started; assuming databases are already running[/yellow]")
+        return
     
-    running_containers = result.stdout.strip().split('\n')
-    for container in running_containers:
-        if container == "llamaspace-timescaledb":
-            containers["timescaledb"] = True
-        elif container == "llamaspace-mongodb":
-            containers["mongodb"] = True
-        elif container == "llamaspace-redis":
-            containers["redis"] = True
+    # Start a container in the background; the API call blocks until it is started
+    def run_container(spec):
+        client.containers.run(detach=True, network="llamaspace-network", **spec)
     
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console
-    ) as progress:
-        # Start TimescaleDB if not running
-        if not containers["timescaledb"]:
-            task = progress.add_task("[cyan]Starting TimescaleDB...", total=None)
-            subprocess.run([
-                "docker", "run", "-d", 
-                "--name", "llamaspace-timescaledb",
-                "--network", "llamaspace-network",
-                "-e", f"POSTGRES_USER={PG_USER}",
-                "-e", f"POSTGRES_PASSWORD={PG_PASSWORD}",
-                "-e", f"POSTGRES_DB={PG_DB}",
-                "-p", f"{PG_PORT}:5432",
-                "-v", "llamaspace-timescaledb-data:/var/lib/postgresql/data",
-                "timescale/timescaledb:latest-pg14"
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            progress.update(task, description="[green]TimescaleDB started")
-        else:
-            progress.add_task("[green]TimescaleDB is already running", completed=True)
-            
-        # Start MongoDB if not running
-        if not containers["mongodb"]:
-            task = progress.add_task("[cyan]Starting MongoDB...", total=None)
-            subprocess.run([
-                "docker", "run", "-d", 
-                "--name", "llamaspace-mongodb",
-                "--network", "llamaspace-network",
-                "-e", f"MONGO_INITDB_ROOT_USERNAME={MONGO_USER}",
-                "-e", f"MONGO_INITDB_ROOT_PASSWORD={MONGO_PASSWORD}",
-                "-p", f"{MONGO_PORT}:27017",
-                "-v", "llamaspace-mongodb-data:/data/db",
-                "mongo:latest"
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            progress.update(task, description="[green]MongoDB started")
-        else:
-            progress.add_task("[green]MongoDB is already running", completed=True)
-            
-        # Start Redis if not running
-        if not containers["redis"]:
-            task = progress.add_task("[cyan]Starting Redis...", total=None)
-            cmd = [
-                "docker", "run", "-d", 
-                "--name", "llamaspace-redis",
-                "--network", "llamaspace-network",
-                "-p", f"{REDIS_PORT}:6379",
-                "-v", "llamaspace-redis-data:/data"
-            ]
-            
-            if REDIS_PASSWORD:
-                cmd.extend(["-e", f"REDIS_PASSWORD={REDIS_PASSWORD}"])
-                
-            cmd.append("redis:latest")
-            
-            if REDIS_PASSWORD:
-                cmd.extend(["--requirepass", REDIS_PASSWORD])
-                
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            progress.update(task, description="[green]Redis started")
-        else:
-            progress.add_task("[green]Redis is already running", completed=True)
+    ) as progress, ThreadPoolExecutor(max_workers=len(DOCKER_CONTAINERS)) as executor:
+        # Launch the missing containers concurrently and wait for them together
+        launches = {}
+        for label, spec in DOCKER_CONTAINERS:
+            if spec["name"] in running_containers:
+                progress.add_task(f"[green]{label} is already running", completed=True)
+                continue
+            task = progress.add_task(f"[cyan]Starting {label}...", total=None)
+            launches[executor.submit(run_container, spec)] = (label, task)
+        
+        # Mark each container as started as soon as its launch completes
+        for future in as_completed(launches):
+            name, task = launches[future]
+            try:
+                future.result()
+                progress.update(task, description=f"[green]{name} started")
+            except docker_errors as e:
+                # The SDK raises transport failures (timeouts, dropped daemon
+                # connections) as raw requests exceptions
+                progress.update(task, description=f"[red]Failed to start {name}: {e}")
     
     # Wait for databases to be ready
     console.print("[yellow]Waiting for databases to be ready...[/yellow]")
-    time.sleep(5)
+    with ThreadPoolExecutor(max_workers=len(READINESS_PROBES)) as executor:
+        ready = dict(zip(READINESS_PROBES, executor.map(wait_ready, READINESS_PROBES.values())))
+    
+    for name, is_ready in ready.items():
+        if not is_ready:
+            console.print(f"[yellow]{name} did not become ready in time[/yellow]")
 
 # Initialize TimescaleDB
 def setup_timescaledb():
     console.print(Panel.fit("Setting up TimescaleDB", style="bold blue"))
     
-    # Connection string
-    db_uri = f"postgresql://{PG_USER}:{PG_PASSWORD}@{PG_HOST}:{PG_PORT}/{PG_DB}"
-    
-    # Connect to database
+    # Connect to database; this is a one-shot script, so skip connection pooling
+    engine = create_engine(
+        PG_URI,
+        poolclass=NullPool,
+        connect_args={"connect_timeout": 5, "application_name": "llamaspace-setup"}
+    )
     try:
-        engine = create_engine(db_uri)
-        with engine.connect() as conn:
-            # Check if TimescaleDB extension is installed
-            result = conn.execute(text("SELECT extname FROM pg_extension WHERE extname = 'timescaledb'"))
-            extension_exists = result.fetchone() is not None
-            
-            if not extension_exists:
-                conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb CASCADE;"))
-                console.print("[green]TimescaleDB extension created[/green]")
-            
-            # Create hypertables for telemetry data
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS satellite_telemetry (
-                    time TIMESTAMPTZ NOT NULL,
-                    satellite_id TEXT NOT NULL,
-                    subsystem TEXT NOT NULL,
-                    parameter TEXT NOT NULL,
-                    value DOUBLE PRECISION,
-                    status TEXT,
-                    metadata JSONB
-                );
-            """))
-            
-            # Make it a hypertable
-            try:
-                conn.execute(text("""
-                    SELECT create_hypertable('satellite_telemetry', 'time', if_not_exists => TRUE);
-                """))
-            except Exception as e:
-                if "already a hypertable" not in str(e):
-                    raise
-            
-            # Create indexes
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_satellite_telemetry_satellite_id ON satellite_telemetry (satellite_id);
-                CREATE INDEX IF NOT EXISTS idx_satellite_telemetry_subsystem ON satellite_telemetry (subsystem);
-                CREATE INDEX IF NOT EXISTS idx_satellite_telemetry_parameter ON satellite_telemetry (parameter);
-            """))
-            
-            # Create orbit table
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS satellite_orbits (
-                    time TIMESTAMPTZ NOT NULL,
-                    satellite_id TEXT NOT NULL,
-                    position_x DOUBLE PRECISION,
-                    position_y DOUBLE PRECISION,
-                    position_z DOUBLE PRECISION,
-                    velocity_x DOUBLE PRECISION,
-                    velocity_y DOUBLE PRECISION,
-                    velocity_z DOUBLE PRECISION,
-                    metadata JSONB
-                );
-            """))
-            
-            # Make it a hypertable
-            try:
-                conn.execute(text("""
-                    SELECT create_hypertable('satellite_orbits', 'time', if_not_exists => TRUE);
-                """))
-            except Exception as e:
-                if "already a hypertable" not in str(e):
-                    raise
-            
-            # Create maneuver table
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS satellite_maneuvers (
-                    id SERIAL PRIMARY KEY,
-                    satellite_id TEXT NOT NULL,
-                    start_time TIMESTAMPTZ NOT NULL,
-                    end_time TIMESTAMPTZ,
-                    type TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    delta_v_x DOUBLE PRECISION,
-                    delta_v_y DOUBLE PRECISION,
-                    delta_v_z DOUBLE PRECISION,
-                    fuel_used DOUBLE PRECISION,
-                    success BOOLEAN,
-                    description TEXT,
-                    parameters JSONB,
-                    created_at TIMESTAMPTZ DEFAULT NOW(),
-                    updated_at TIMESTAMPTZ DEFAULT NOW()
-                );
-            """))
-            
-            console.print("[green]TimescaleDB tables and hypertables created[/green]")
-            
+        # Every statement is idempotent, so the whole schema is sent as one
+        # multi-statement batch in a single transaction and round-trip
+        with engine.begin() as conn:
+            conn.exec_driver_sql(TIMESCALEDB_DDL)
+        
+        console.print("[green]TimescaleDB tables and hypertables created[/green]")
+        
     except OperationalError as e:
         console.print(f"[red]Error connecting to TimescaleDB: {e}[/red]")
         if "Connection refused" in str(e):
             console.print("[yellow]Make sure TimescaleDB is running and accessible[/yellow]")
         return False
+    finally:
+        engine.dispose()
     
     return True
 
@@ -285,134 +453,52 @@ def setup_timescaledb():
 def setup_mongodb():
     console.print(Panel.fit("Setting up MongoDB", style="bold blue"))
     
-    # Connection string
-    if MONGO_USER and MONGO_PASSWORD:
-        mongo_uri = f"mongodb://{MONGO_USER}:{MONGO_PASSWORD}@{MONGO_HOST}:{MONGO_PORT}/{MONGO_DB}?authSource=admin"
-    else:
-        mongo_uri = f"mongodb://{MONGO_HOST}:{MONGO_PORT}/{MONGO_DB}"
-    
     try:
-        # Connect to MongoDB
-        client = pymongo.MongoClient(mongo_uri)
+        # Connect to MongoDB lazily; the pool only needs one connection per
+        # collection-setup worker. Any Docker start has already waited for
+        # the server to answer a ping, so fail fast if it is unreachable
+        client = pymongo.MongoClient(
+            MONGO_URI,
+            connect=False,
+            maxPoolSize=len(MONGO_COLLECTIONS),
+            serverSelectionTimeoutMS=5000
+        )
         db = client[MONGO_DB]
         
-        # Create collections with validation schemas
-        
-        # Satellites collection
-        db.create_collection("satellites", validator={
-            "$jsonSchema": {
-                "bsonType": "object",
-                "required": ["satellite_id", "name", "type", "status"],
-                "properties": {
-                    "satellite_id": {"bsonType": "string"},
-                    "name": {"bsonType": "string"},
-                    "type": {"bsonType": "string"},
-                    "status": {"bsonType": "string"},
-                    "launch_date": {"bsonType": "date"},
-                    "mission": {"bsonType": "string"},
-                    "owner": {"bsonType": "string"},
-                    "tle": {
-                        "bsonType": "object",
-                        "properties": {
-                            "line1": {"bsonType": "string"},
-                            "line2": {"bsonType": "string"},
-                            "epoch": {"bsonType": "date"}
-                        }
-                    },
-                    "subsystems": {"bsonType": "array"},
-                    "metadata": {"bsonType": "object"}
-                }
-            }
-        })
-        
-        # Ground Stations collection
-        db.create_collection("ground_stations", validator={
-            "$jsonSchema": {
-                "bsonType": "object",
-                "required": ["station_id", "name", "location"],
-                "properties": {
-                    "station_id": {"bsonType": "string"},
-                    "name": {"bsonType": "string"},
-                    "location": {
-                        "bsonType": "object",
-                        "required": ["latitude", "longitude"],
-                        "properties": {
-                            "latitude": {"bsonType": "double"},
-                            "longitude": {"bsonType": "double"},
-                            "altitude": {"bsonType": "double"}
-                        }
-                    },
-                    "capabilities": {"bsonType": "array"},
-                    "status": {"bsonType": "string"},
-                    "metadata": {"bsonType": "object"}
-                }
-            }
-        })
-        
-        # Users collection
-        db.create_collection("users", validator={
-            "$jsonSchema": {
-                "bsonType": "object",
-                "required": ["username", "email", "role"],
-                "properties": {
-                    "username": {"bsonType": "string"},
-                    "email": {"bsonType": "string"},
-                    "first_name": {"bsonType": "string"},
-                    "last_name": {"bsonType": "string"},
-                    "role": {"bsonType": "string"},
-                    "permissions": {"bsonType": "array"},
-                    "created_at": {"bsonType": "date"},
-                    "last_login": {"bsonType": "date"},
-                    "settings": {"bsonType": "object"}
-                }
-            }
-        })
-        
-        # Mission Plans collection
-        db.create_collection("mission_plans", validator={
-            "$jsonSchema": {
-                "bsonType": "object",
-                "required": ["plan_id", "name", "satellite_id", "status"],
-                "properties": {
-                    "plan_id": {"bsonType": "string"},
-                    "name": {"bsonType": "string"},
-                    "satellite_id": {"bsonType": "string"},
-                    "created_by": {"bsonType": "string"},
-                    "created_at": {"bsonType": "date"},
-                    "status": {"bsonType": "string"},
-                    "start_time": {"bsonType": "date"},
-                    "end_time": {"bsonType": "date"},
-                    "activities": {"bsonType": "array"},
-                    "metadata": {"bsonType": "object"}
-                }
-            }
-        })
+        # Create each collection and its indexes concurrently; within a
+        # collection all indexes are sent in a single createIndexes command
+        def create_collection(name, validator, indexes):
+            try:
+                db.create_collection(name, validator=validator)
+            except pymongo.errors.CollectionInvalid:
+                # Collection already exists
+                pass
+            db[name].create_indexes(indexes)
         
-        # Create indexes
-        db.satellites.create_index("satellite_id", unique=True)
-        db.ground_stations.create_index("station_id", unique=True)
-        db.users.create_index("username", unique=True)
-        db.users.create_index("email", unique=True)
-        db.mission_plans.create_index("plan_id", unique=True)
-        db.mission_plans.create_index("satellite_id")
+        with ThreadPoolExecutor(max_workers=len(MONGO_COLLECTIONS)) as executor:
+            futures = [executor.submit(create_collection, *spec) for spec in MONGO_COLLECTIONS]
+            for future in futures:
+                future.result()
         
         console.print("[green]MongoDB collections and indexes created[/green]")
         
         # Insert sample data if collections are empty
+        # Load sample data from YAML files if available. The sample files are
+        # trusted, so server-side validation is skipped for the bulk inserts;
+        # the validators still apply to all later application writes
+        sample_data_path = DATA_DIR / "samples"
         if db.satellites.count_documents({}) == 0:
-            # Load sample data from YAML files if available
-            sample_data_path = DATA_DIR / "samples"
             if (sample_data_path / "satellites.yaml").exists():
-                with open(sample_data_path / "satellites.yaml", "r") as f:
-                    satellites = yaml.safe_load(f)
-                    db.satellites.insert_many(satellites)
+                with open(sample_data_path / "satellites.yaml", "rb") as f:
+                    satellites = yaml.load(f, Loader=YamlLoader)
+                db.satellites.insert_many(satellites, ordered=False, bypass_document_validation=True)
                 console.print("[green]Sample satellite data loaded[/green]")
                 
         if db.ground_stations.count_documents({}) == 0:
             if (sample_data_path / "ground_stations.yaml").exists():
-                with open(sample_data_path / "ground_stations.yaml", "r") as f:
-                    stations = yaml.safe_load(f)
-                    db.ground_stations.insert_many(stations)
+                with open(sample_data_path / "ground_stations.yaml", "rb") as f:
+                    stations = yaml.load(f, Loader=YamlLoader)
+                db.ground_stations.insert_many(stations, ordered=False, bypass_document_validation=True)
                 console.print("[green]Sample ground station data loaded[/green]")
         
         # Create default admin user if no users exist
@@ -424,7 +510,7 @@ def setup_mongodb():
                 "last_name": "User",
                 "role": "admin",
                 "permissions": ["*"],
-                "created_at": datetime.datetime.utcnow(),
+                "created_at": datetime.datetime.now(datetime.timezone.utc),
                 "settings": {
                     "theme": "dark",
                     "notifications_enabled": True
@@ -468,10 +554,9 @@ def setup_redis():
             "pub_sub": "llamaspace:pubsub:"
         }
         
-        # Store key prefixes
-        r.hset("llamaspace:config:key_prefixes", mapping=key_prefixes)
-        
-        # Set up pub/sub channels
+        # Pub/sub channels used by the platform. Redis channels need no
+        # initialization (messages published with no subscribers are
+        # dropped), so they are only recorded in a registry for discovery
         channels = [
             "telemetry_stream",
             "command_stream",
@@ -480,22 +565,25 @@ def setup_redis():
             "user_notifications"
         ]
         
-        for channel in channels:
-            # Publish a system message to initialize channels
-            r.publish(f"{key_prefixes['pub_sub']}{channel}", 
-                     json.dumps({
-                         "type": "system",
-                         "message": f"Channel {channel} initialized",
-                         "timestamp": time.time()
-                     }))
+        # Queue every initialization command and send them in a single
+        # round-trip; they are independent, so no MULTI/EXEC is needed
+        pipe = r.pipeline(transaction=False)
+        
+        # Store key prefixes
+        pipe.hset("llamaspace:config:key_prefixes", mapping=key_prefixes)
+        
+        # Register channel names
+        pipe.sadd("llamaspace:channels", *channels)
         
         # Store some configuration in Redis
-        r.hset("llamaspace:config:app", mapping={
+        pipe.hset("llamaspace:config:app", mapping={
             "version": "1.0.0",
             "environment": os.getenv("ENVIRONMENT", "development"),
             "initialized_at": str(int(time.time()))
         })
         
+        pipe.execute()
+        
         console.print("[green]Redis initialized successfully[/green]")
         
     except redis.exceptions.ConnectionError as e:
@@ -512,25 +600,51 @@ def setup_redis():
 def main():
     console.print(Panel.fit("LlamaSpace Pro Database Setup", style="bold cyan"))
     
+    # Skip Docker entirely when every database is already serving
+    all_up = all(probe() for probe in READINESS_PROBES.values())
+    
     # Check if Docker is available and start containers if needed
-    if is_docker_available():
-        start_docker_databases()
+    docker_client = None if all_up else get_docker_client()
+    if all_up:
+        console.print("[green]All databases are already reachable, skipping Docker startup[/green]")
+    elif docker_client is not None:
+        start_docker_databases(docker_client)
     else:
         console.print("[yellow]Docker not found. Assuming databases are already running.[/yellow]")
         console.print("[yellow]If databases are not running, please start them manually.[/yellow]")
     
     # Create required directories
-    DATA_DIR.mkdir(exist_ok=True)
-    (DATA_DIR / "db").mkdir(exist_ok=True)
-    (DATA_DIR / "samples").mkdir(exist_ok=True)
+    (DATA_DIR / "db").mkdir(parents=True, exist_ok=True)
+    (DATA_DIR / "samples").mkdir(parents=True, exist_ok=True)
+    
+    # Setup each database concurrently; the three targets are independent
+    # and each setup spends most of its time waiting on network round-trips
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            name: executor.submit(setup)
+            for name, setup in [
+                ("timescaledb", setup_timescaledb),
+                ("mongodb", setup_mongodb),
+                ("redis", setup_redis)
+            ]
+        }
+        # A setup that raises counts as failed, so the other results and
+        # the summary are still reported
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                console.print(f"[red]Unexpected error during {name} setup: {e}[/red]")
+                results[name] = False
     
-    # Setup each database
-    timescaledb_success = setup_timescaledb()
-    mongodb_success = setup_mongodb()
-    redis_success = setup_redis()
+    timescaledb_success = results["timescaledb"]
+    mongodb_success = results["mongodb"]
+    redis_success = results["redis"]
     
     # Summary
-    console.print("\n" + Panel.fit("Setup Summary", style="bold cyan"))
+    console.print()
+    console.print(Panel.fit("Setup Summary", style="bold cyan"))
     console.print(f"TimescaleDB: {'[green]SUCCESS[/green]' if timescaledb_success else '[red]FAILED[/red]'}")
     console.print(f"MongoDB:     {'[green]SUCCESS[/green]' if mongodb_success else '[red]FAILED[/red]'}")
     console.print(f"Redis:       {'[green]SUCCESS[/green]' if redis_success else '[red]FAILED[/red]'}")
@@ -543,6 +657,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    # Import here to avoid circular imports
-    import datetime
     sys.exit(main()) 
\ No newline at end of file
@@ -1,4 +1,6 @@
 
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
 """
@@ -23,7 +25,7 @@ setup(
     author="LlamaSearch AI",
     author_email="nikjois@llamasearch.ai",
     description="LlamaSearch AI Package",
-    long_description=open("README.md").read(),
+    long_description=Path(__file__).with_name("README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     url="https://llamasearch.ai",
     classifiers=[
@@ -38,67 +40,3 @@ setup(
     ],
     python_requires=">=3.8",
 )
-
-# Updated in commit 5 - 2025-04-04 17:24:15
-
-# Updated in commit 13 - 2025-04-04 17:24:16
-
-# Updated in commit 21 - 2025-04-04 17:24:16
-
-# Updated in commit 29 - 2025-04-04 17:24:17
-
-# Updated in commit 5 - 2025-04-05 14:31:27
-
-# Updated in commit 13 - 2025-04-05 14:31:27
-
-# Updated in commit 21 - 2025-04-05 14:31:27
-
-# Updated in commit 29 - 2025-04-05 14:31:27
-
-# Updated in commit 5 - 2025-04-05 15:17:54
-
-# Updated in commit 13 - 2025-04-05 15:17:55
-
-# Updated in commit 21 - 2025-04-05 15:17:55
-
-# Updated in commit 29 - 2025-04-05 15:17:55
-
-# Updated in commit 5 - 2025-04-05 15:48:42
-
-# Updated in commit 13 - 2025-04-05 15:48:42
-
-# Updated in commit 21 - 2025-04-05 15:48:43
-
-# Updated in commit 29 - 2025-04-05 15:48:43
-
-# Updated in commit 5 - 2025-04-05 16:54:04
-
-# Updated in commit 13 - 2025-04-05 16:54:04
-
-# Updated in commit 21 - 2025-04-05 16:54:05
-
-# Updated in commit 29 - 2025-04-05 16:54:05
-
-# Updated in commit 5 - 2025-04-05 17:25:44
-
-# Updated in commit 13 - 2025-04-05 17:25:45
-
-# Updated in commit 21 - 2025-04-05 17:25:45
-
-# Updated in commit 29 - 2025-04-05 17:25:45
-
-# Updated in commit 5 - 2025-04-05 18:12:52
-
-# Updated in commit 13 - 2025-04-05 18:12:52
-
-# Updated in commit 21 - 2025-04-05 18:12:52
-
-# Updated in commit 29 - 2025-04-05 18:12:52
-
-# Updated in commit 5 - 2025-04-05 18:36:56
-
-# Updated in commit 13 - 2025-04-05 18:36:56
-
-# Updated in commit 21 - 2025-04-05 18:36:57
-
-# Updated in commit 29 - 2025-04-05 18:36:57